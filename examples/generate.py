@@ -10,6 +10,7 @@
 Usage:
     python examples/generate.py --num-samples 100
     python examples/generate.py --num-samples 100 --output data/my_task --seed 42
+    python examples/generate.py --num-samples 1000 --workers 8
 """
 
 import argparse
@@ -56,6 +57,17 @@ Examples:
         action="store_true",
         help="Disable video generation"
     )
+    parser.add_argument(
+        "--video-cache",
+        action="store_true",
+        help="Reuse videos for samples with the same rounded parameters"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel worker processes (default: 1)"
+    )
     
     args = parser.parse_args()
     
@@ -71,6 +83,8 @@ Examples:
         random_seed=args.seed,
         output_dir=Path(args.output),
         generate_videos=not args.no_videos,
+        num_workers=args.workers,
+        video_cache=args.video_cache,
     )
     
     # Generate tasks
@@ -17,6 +17,7 @@ setup(
     long_description=readme,
     long_description_content_type="text/markdown",
     packages=find_packages(include=["core", "core.*", "src", "src.*"]),
+    package_data={"src": ["assets/*.ttf", "assets/*.txt"]},
     python_requires=">=3.8",
     install_requires=requirements,
 )
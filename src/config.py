@@ -7,7 +7,7 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from core import GenerationConfig
 
 
@@ -24,8 +24,13 @@ class TaskConfig(GenerationConfig):
         - random_seed: Optional[int] # For reproducibility
         - output_dir: Path          # Where to save outputs
         - image_size: tuple[int, int] # Image dimensions
+    
+    Validated once when built at the entry point, then immutable (frozen):
+    the same config object is shared by the generator and pickled to workers.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     # ══════════════════════════════════════════════════════════════════════════
     #  OVERRIDE DEFAULTS
     # ══════════════════════════════════════════════════════════════════════════
@@ -33,6 +38,16 @@ class TaskConfig(GenerationConfig):
     domain: str = Field(default="glass_refraction")
     image_size: tuple[int, int] = Field(default=(512, 512))
     
+    # ══════════════════════════════════════════════════════════════════════════
+    #  GENERATION SETTINGS
+    # ══════════════════════════════════════════════════════════════════════════
+    
+    num_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Worker processes used by generate_dataset (1 = sequential)"
+    )
+    
     # ══════════════════════════════════════════════════════════════════════════
     #  VIDEO SETTINGS
     # ══════════════════════════════════════════════════════════════════════════
@@ -47,6 +62,27 @@ class TaskConfig(GenerationConfig):
         description="Video frame rate"
     )
     
+    video_hold_frames: int = Field(
+        default=5,
+        ge=0,
+        description="Frames to hold the initial and final state"
+    )
+    
+    # The refracted ray only grows along a fixed line, so a few frames of
+    # linear interpolation look the same as many
+    video_transition_frames: int = Field(
+        default=10,
+        ge=1,
+        description="Frames for the refracted ray to grow to the image edge"
+    )
+    
+    video_cache: bool = Field(
+        default=False,
+        description="Reuse videos across samples with the same rounded n_glass/angle "
+                    "(stored in output_dir/.video_cache); rounds sampled values to "
+                    "2 decimals (n_glass) and 0.1 degrees (angle)"
+    )
+    
     # ══════════════════════════════════════════════════════════════════════════
     #  TASK-SPECIFIC SETTINGS
     # ══════════════════════════════════════════════════════════════════════════
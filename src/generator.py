@@ -7,18 +7,35 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import os
 import random
 import tempfile
 import math
+import functools
+import importlib.resources
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator, List, Optional
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from core import BaseGenerator, TaskPair, ImageRenderer
-from core.video_utils import VideoGenerator
+from core.video_utils import VideoGenerator, cv2
 from .config import TaskConfig
+from .geometry import refracted_endpoint, arrowhead
 from .prompts import get_prompt
 
 
+# Glass hatch lines: 15px diagonal strokes at 45 degrees, every 8px
+_HATCH_SPACING = 8
+_HATCH_DX = 15 * math.cos(math.radians(45))
+_HATCH_DY = 15 * math.sin(math.radians(45))
+
+# Part of the video cache key; bump whenever the rendered frames change so
+# stale entries in output_dir/.video_cache are not reused
+_RENDER_VERSION = 1
+
+
 class TaskGenerator(BaseGenerator):
     """
     Optics refraction task generator.
@@ -32,8 +49,54 @@ class TaskGenerator(BaseGenerator):
         
         # Initialize video generator if enabled (using mp4 format)
         self.video_generator = None
+        # The video cache is only active when videos are actually rendered
+        self._video_cache_enabled = False
         if config.generate_videos and VideoGenerator.is_available():
             self.video_generator = VideoGenerator(fps=config.video_fps, output_format="mp4")
+            self._video_tmpdir = Path(tempfile.gettempdir()) / f"{config.domain}_videos"
+            self._video_tmpdir.mkdir(parents=True, exist_ok=True)
+            if config.video_cache:
+                self._video_cache_enabled = True
+                self._video_cache_dir = Path(config.output_dir) / ".video_cache"
+                self._video_cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Glass surface, hatching and normal are identical for every frame, so draw them once
+        self._background = self._build_static_background()
+    
+    def generate_dataset(self) -> List[TaskPair]:
+        """Generate complete dataset, in parallel when num_workers > 1."""
+        task_ids = [f"{self.config.domain}_{i:04d}" for i in range(self.config.num_samples)]
+        
+        if self.config.num_workers > 1:
+            # Each worker builds its own generator once, so only task ids and
+            # finished pairs cross the process boundary
+            with ProcessPoolExecutor(
+                max_workers=self.config.num_workers,
+                initializer=_init_worker,
+                initargs=(self.config,)
+            ) as executor:
+                return self._collect(task_ids, executor.map(_generate_in_worker, task_ids))
+        
+        return self._collect(task_ids, map(self._generate_one, task_ids))
+    
+    def _generate_one(self, task_id: str) -> TaskPair:
+        """Generate a single task, seeded from (random_seed, task_id) if a seed is set.
+        
+        Per-task seeding makes the dataset independent of worker count and
+        scheduling order.
+        """
+        if self.config.random_seed is not None:
+            random.seed(f"{self.config.random_seed}_{task_id}")
+            np.random.seed(random.getrandbits(32))
+        return self.generate_task_pair(task_id)
+    
+    @staticmethod
+    def _collect(task_ids: List[str], results) -> List[TaskPair]:
+        pairs = []
+        for task_id, pair in zip(task_ids, results):
+            pairs.append(pair)
+            print(f"  Generated: {task_id}")
+        return pairs
     
     def generate_task_pair(self, task_id: str) -> TaskPair:
         """Generate one task pair."""
@@ -75,6 +138,13 @@ class TaskGenerator(BaseGenerator):
         
         # Random incident angle (theta) in degrees
         theta_degrees = random.uniform(self.config.theta_min, self.config.theta_max)
+        
+        # With the video cache, snap values to the cache key precision so that
+        # samples sharing a key render identical images and videos
+        if self._video_cache_enabled:
+            n_glass = round(n_glass, 2)
+            theta_degrees = round(theta_degrees, 1)
+        
         theta_radians = math.radians(theta_degrees)
         
         # Calculate refraction angle using Snell's law: n1 * sin(theta1) = n2 * sin(theta2)
@@ -88,6 +158,9 @@ class TaskGenerator(BaseGenerator):
         theta_refracted_radians = math.asin(sin_theta_refracted)
         theta_refracted_degrees = math.degrees(theta_refracted_radians)
         
+        # Keep the ray direction as sin/cos so renderers never need tan(asin(...))
+        cos_theta_refracted = math.sqrt(1.0 - sin_theta_refracted * sin_theta_refracted)
+        
         return {
             "n_glass": n_glass,
             "n_air": self.config.n_air,
@@ -95,36 +168,19 @@ class TaskGenerator(BaseGenerator):
             "theta_incident_radians": theta_radians,
             "theta_refracted_degrees": theta_refracted_degrees,
             "theta_refracted_radians": theta_refracted_radians,
+            "sin_refracted": sin_theta_refracted,
+            "cos_refracted": cos_theta_refracted,
             "type": "default"
         }
     
     def _render_initial_state(self, task_data: dict) -> Image.Image:
         """Render initial state: glass surface, incident ray, and angle annotation."""
-        img = self.renderer.create_blank_image(bg_color=(255, 255, 255))
+        img = self._background.copy()
         draw = ImageDraw.Draw(img)
         
         width, height = self.config.image_size
         center_x, center_y = width // 2, height // 2
-        
-        # Glass surface: horizontal line in the middle
         glass_y = center_y
-        glass_line_width = 3
-        draw.line([(0, glass_y), (width, glass_y)], fill=(0, 0, 0), width=glass_line_width)
-        
-        # Glass hatch lines (below the surface)
-        hatch_spacing = 8
-        hatch_length = 15
-        hatch_angle = 45  # degrees
-        num_hatches = width // hatch_spacing
-        
-        for i in range(num_hatches):
-            x = i * hatch_spacing
-            # Draw diagonal hatch lines
-            x1 = x
-            y1 = glass_y + 5
-            x2 = x1 + hatch_length * math.cos(math.radians(hatch_angle))
-            y2 = y1 + hatch_length * math.sin(math.radians(hatch_angle))
-            draw.line([(x1, y1), (x2, y2)], fill=(100, 100, 100), width=1)
         
         # Incident ray: from top-left to glass surface
         theta = task_data["theta_incident_radians"]
@@ -143,11 +199,6 @@ class TaskGenerator(BaseGenerator):
         self._draw_arrow(draw, (ray_start_x, ray_start_y), (ray_end_x, ray_end_y), 
                         color=(0, 0, 255), width=3)
         
-        # Draw normal line (perpendicular to glass surface)
-        normal_length = 30
-        draw.line([(center_x, glass_y - normal_length), (center_x, glass_y + normal_length)], 
-                 fill=(150, 150, 150), width=1)
-        
         # Draw angle arc and label
         angle_arc_radius = 40
         # Angle arc from normal to incident ray
@@ -176,30 +227,12 @@ class TaskGenerator(BaseGenerator):
     
     def _render_final_state(self, task_data: dict) -> Image.Image:
         """Render final state: glass surface, incident ray, refracted ray."""
-        img = self.renderer.create_blank_image(bg_color=(255, 255, 255))
+        img = self._background.copy()
         draw = ImageDraw.Draw(img)
         
         width, height = self.config.image_size
         center_x, center_y = width // 2, height // 2
-        
-        # Glass surface: horizontal line in the middle
         glass_y = center_y
-        glass_line_width = 3
-        draw.line([(0, glass_y), (width, glass_y)], fill=(0, 0, 0), width=glass_line_width)
-        
-        # Glass hatch lines (below the surface)
-        hatch_spacing = 8
-        hatch_length = 15
-        hatch_angle = 45  # degrees
-        num_hatches = width // hatch_spacing
-        
-        for i in range(num_hatches):
-            x = i * hatch_spacing
-            x1 = x
-            y1 = glass_y + 5
-            x2 = x1 + hatch_length * math.cos(math.radians(hatch_angle))
-            y2 = y1 + hatch_length * math.sin(math.radians(hatch_angle))
-            draw.line([(x1, y1), (x2, y2)], fill=(100, 100, 100), width=1)
         
         # Incident ray: from top-left to glass surface
         theta_incident = task_data["theta_incident_radians"]
@@ -213,43 +246,20 @@ class TaskGenerator(BaseGenerator):
         self._draw_arrow(draw, (ray_start_x, ray_start_y), (ray_end_x, ray_end_y), 
                         color=(0, 0, 255), width=3)
         
-        # Refracted ray: from glass surface into glass
-        theta_refracted = task_data["theta_refracted_radians"]
-        
         # Refracted ray goes into glass (below surface)
         # Calculate where the ray hits the bottom edge of the image
         # Ray starts at (center_x, glass_y) and propagates at angle theta_refracted
         # We need to find intersection with bottom edge (y = height) or side edge
         
-        # Calculate intersection with bottom edge first
-        distance_to_bottom = height - glass_y
-        x_at_bottom = center_x + distance_to_bottom * math.tan(theta_refracted)
-        
-        # Check if ray hits bottom edge or side edge first
-        if 0 <= x_at_bottom <= width:
-            # Ray hits bottom edge
-            refracted_end_x = x_at_bottom
-            refracted_end_y = height
-        elif x_at_bottom > width:
-            # Ray hits right edge
-            distance_to_right = width - center_x
-            refracted_end_x = width
-            refracted_end_y = glass_y + distance_to_right / math.tan(theta_refracted)
-        else:
-            # Ray hits left edge (shouldn't happen for normal refraction, but handle it)
-            distance_to_left = center_x
-            refracted_end_x = 0
-            refracted_end_y = glass_y + distance_to_left / math.tan(theta_refracted)
+        refracted_end_x, refracted_end_y = refracted_endpoint(
+            center_x, glass_y, width, height,
+            task_data["sin_refracted"], task_data["cos_refracted"]
+        )
         
         # Draw refracted ray with arrow (extending to edge)
         self._draw_arrow(draw, (center_x, glass_y), (refracted_end_x, refracted_end_y), 
                         color=(255, 0, 0), width=3)
         
-        # Draw normal line
-        normal_length = 30
-        draw.line([(center_x, glass_y - normal_length), (center_x, glass_y + normal_length)], 
-                 fill=(150, 150, 150), width=1)
-        
         return img
     
     def _generate_video(
@@ -260,40 +270,78 @@ class TaskGenerator(BaseGenerator):
         task_data: dict
     ) -> str:
         """Generate ground truth video showing light refraction."""
-        temp_dir = Path(tempfile.gettempdir()) / f"{self.config.domain}_videos"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        video_path = temp_dir / f"{task_id}_ground_truth.mp4"
+        if self._video_cache_enabled:
+            key = self._video_cache_key(task_data)
+            video_path = self._video_cache_dir / f"{key}.mp4"
+            if video_path.exists():
+                return str(video_path)
+            # Render under a per-process name and move into place atomically,
+            # so parallel workers never see a partially written cache entry
+            render_path = video_path.with_name(f"{key}.{os.getpid()}.part.mp4")
+        else:
+            video_path = render_path = self._video_tmpdir / f"{task_id}_ground_truth.mp4"
         
-        # Create animation frames
-        frames = self._create_refraction_animation_frames(task_data)
+        # Animation frames are streamed straight into the video writer
+        frames = self._create_refraction_animation_frames(
+            task_data,
+            first_image=first_image,
+            final_image=final_image
+        )
         
+        # Pass the size explicitly: a generator cannot be indexed for frames[0]
         result = self.video_generator.create_video_from_frames(
             frames,
-            video_path
+            render_path,
+            size=self.config.image_size
         )
         
+        if result and render_path != video_path:
+            os.replace(result, video_path)
+            result = video_path
+        
         return str(result) if result else None
     
+    def _video_cache_key(self, task_data: dict) -> str:
+        """Cache key for a ground truth video: rounded physics plus render settings."""
+        width, height = self.config.image_size
+        return (
+            f"v{_RENDER_VERSION}"
+            f"_n{task_data['n_glass']:.2f}_nair{task_data['n_air']!r}"
+            f"_theta{task_data['theta_incident_degrees']:.1f}"
+            f"_{width}x{height}_{self.config.video_fps}fps"
+            f"_{self.config.video_hold_frames}h{self.config.video_transition_frames}t"
+        )
+    
     def _create_refraction_animation_frames(
         self,
         task_data: dict,
-        hold_frames: int = 5,
-        transition_frames: int = 25
-    ) -> list:
+        first_image: Optional[Image.Image] = None,
+        final_image: Optional[Image.Image] = None,
+        hold_frames: Optional[int] = None,
+        transition_frames: Optional[int] = None
+    ) -> Iterator[Image.Image]:
         """
-        Create animation frames showing light entering glass and refracting.
+        Yield animation frames showing light entering glass and refracting.
         
         The animation shows:
         1. Initial state: incident ray approaching glass
         2. Transition: ray entering glass and refracting
         3. Final state: refracted ray propagating in glass
+        
+        Already rendered first/final images are reused for the hold frames;
+        they are only rendered here when not provided. Frame counts default
+        to the config's video_hold_frames / video_transition_frames.
         """
-        frames = []
+        if hold_frames is None:
+            hold_frames = self.config.video_hold_frames
+        if transition_frames is None:
+            transition_frames = self.config.video_transition_frames
         
         # Hold initial position
-        first_frame = self._render_initial_state(task_data)
+        if first_image is None:
+            first_image = self._render_initial_state(task_data)
         for _ in range(hold_frames):
-            frames.append(first_frame)
+            yield first_image
         
         # Create transition frames
         width, height = self.config.image_size
@@ -301,149 +349,164 @@ class TaskGenerator(BaseGenerator):
         glass_y = center_y
         
         theta_incident = task_data["theta_incident_radians"]
-        theta_refracted = task_data["theta_refracted_radians"]
         
         # Calculate ray positions
         ray_length_above = center_y - 50
         ray_start_x = center_x - ray_length_above * math.tan(theta_incident)
         ray_start_y = 50
         
-        ray_length_below = height - center_y - 50
-        refracted_end_x = center_x + ray_length_below * math.tan(theta_refracted)
-        refracted_end_y = height - 50
+        # Final refracted ray end position (at image edge)
+        final_end_x, final_end_y = refracted_endpoint(
+            center_x, glass_y, width, height,
+            task_data["sin_refracted"], task_data["cos_refracted"]
+        )
         
-        for i in range(transition_frames):
-            progress = i / (transition_frames - 1) if transition_frames > 1 else 1.0
-            
-            # Create frame with animated ray
-            img = self.renderer.create_blank_image(bg_color=(255, 255, 255))
-            draw = ImageDraw.Draw(img)
-            
-            # Draw glass surface
-            glass_line_width = 3
-            draw.line([(0, glass_y), (width, glass_y)], fill=(0, 0, 0), width=glass_line_width)
-            
-            # Draw glass hatch lines
-            hatch_spacing = 8
-            hatch_length = 15
-            hatch_angle = 45
-            num_hatches = width // hatch_spacing
-            
-            for j in range(num_hatches):
-                x = j * hatch_spacing
-                x1 = x
-                y1 = glass_y + 5
-                x2 = x1 + hatch_length * math.cos(math.radians(hatch_angle))
-                y2 = y1 + hatch_length * math.sin(math.radians(hatch_angle))
-                draw.line([(x1, y1), (x2, y2)], fill=(100, 100, 100), width=1)
-            
-            # Draw normal line
-            normal_length = 30
-            draw.line([(center_x, glass_y - normal_length), (center_x, glass_y + normal_length)], 
-                     fill=(150, 150, 150), width=1)
-            
-            # Draw incident ray (always visible)
-            self._draw_arrow(draw, (ray_start_x, ray_start_y), (center_x, glass_y), 
-                            color=(0, 0, 255), width=3)
+        refracted_dx = final_end_x - center_x
+        refracted_dy = final_end_y - glass_y
+        
+        # Angle arc and label (same as in initial state)
+        theta_degrees = task_data["theta_incident_degrees"]
+        angle_label = f"θ = {theta_degrees:.0f}°"
+        angle_arc_radius = 40
+        start_angle = -90  # Normal points up
+        end_angle = -90 - math.degrees(theta_incident)  # Ray angle
+        bbox = (center_x - angle_arc_radius, glass_y - angle_arc_radius,
+                center_x + angle_arc_radius, glass_y + angle_arc_radius)
+        label_x = center_x + angle_arc_radius + 10
+        label_y = glass_y - angle_arc_radius
+        font = self._get_font(size=20)
+        
+        # Everything except the growing refracted ray is fixed, so pre-compose
+        # the two possible base frames (with and without the angle annotation)
+        # once and only rasterize the refracted ray per frame.
+        base = self._background.copy()
+        draw = ImageDraw.Draw(base)
+        self._draw_arrow(draw, (ray_start_x, ray_start_y), (center_x, glass_y), 
+                        color=(0, 0, 255), width=3)
+        base_plain = np.asarray(base)
+        draw.arc(bbox, start=end_angle, end=start_angle, fill=(0, 0, 0), width=2)
+        draw.text((label_x, label_y), angle_label, fill=(0, 0, 0), font=font)
+        base_annotated = np.asarray(base)
+        
+        # Per-frame refracted ray tips for the whole transition at once
+        # (fixed angle, only the length grows with progress)
+        if transition_frames > 1:
+            progress = np.linspace(0.0, 1.0, transition_frames)
+        else:
+            progress = np.ones(transition_frames)
+        tips = np.column_stack((center_x + refracted_dx * progress,
+                                glass_y + refracted_dy * progress))
+        
+        # The shaft direction never changes, so the arrowhead barbs sit at a
+        # constant offset from the tip
+        ray_origin = (center_x, glass_y)
+        barb1_x, barb1_y, barb2_x, barb2_y = arrowhead(ray_origin, (final_end_x, final_end_y))
+        barb1 = tips + (barb1_x - final_end_x, barb1_y - final_end_y)
+        barb2 = tips + (barb2_x - final_end_x, barb2_y - final_end_y)
+        # Plain Python numbers for the loop: indexing NumPy arrays per frame
+        # would box a new scalar on every access
+        tips, barb1, barb2 = (list(map(tuple, np.rint(pts).astype(int).tolist()))
+                              for pts in (tips, barb1, barb2))
+        
+        # One reusable frame buffer; Image.fromarray copies it, so overwriting
+        # it for the next frame does not affect frames already yielded
+        frame = np.empty_like(base_plain)
+        
+        for frame_progress, tip, tip_barb1, tip_barb2 in zip(progress.tolist(), tips, barb1, barb2):
+            # Angle label and arc are only shown in the initial frames
+            np.copyto(frame, base_annotated if frame_progress < 0.3 else base_plain)
             
             # Draw refracted ray (appears gradually)
-            if progress > 0:
-                # Calculate final refracted ray end position (at image edge)
-                distance_to_bottom = height - glass_y
-                x_at_bottom = center_x + distance_to_bottom * math.tan(theta_refracted)
-                
-                if 0 <= x_at_bottom <= width:
-                    final_end_x = x_at_bottom
-                    final_end_y = height
-                elif x_at_bottom > width:
-                    distance_to_right = width - center_x
-                    final_end_x = width
-                    final_end_y = glass_y + distance_to_right / math.tan(theta_refracted)
-                else:
-                    distance_to_left = center_x
-                    final_end_x = 0
-                    final_end_y = glass_y + distance_to_left / math.tan(theta_refracted)
-                
-                # Current position based on progress (fixed angle, just extend length)
-                current_end_x = center_x + (final_end_x - center_x) * progress
-                current_end_y = glass_y + (final_end_y - glass_y) * progress
-                
-                self._draw_arrow(draw, (center_x, glass_y), (current_end_x, current_end_y), 
-                                color=(255, 0, 0), width=3)
-            
-            # Draw angle label and arc (only in initial frames)
-            if progress < 0.3:
-                theta_degrees = task_data["theta_incident_degrees"]
-                theta = task_data["theta_incident_radians"]
-                angle_label = f"θ = {theta_degrees:.0f}°"
-                angle_arc_radius = 40
-                
-                # Draw angle arc (same as in initial state)
-                start_angle = -90  # Normal points up
-                end_angle = -90 - math.degrees(theta)  # Ray angle
-                bbox = (center_x - angle_arc_radius, glass_y - angle_arc_radius,
-                        center_x + angle_arc_radius, glass_y + angle_arc_radius)
-                draw.arc(bbox, start=end_angle, end=start_angle, fill=(0, 0, 0), width=2)
-                
-                # Position label near the angle arc
-                label_x = center_x + angle_arc_radius + 10
-                label_y = glass_y - angle_arc_radius
-                font = self._get_font(size=20)
-                draw.text((label_x, label_y), angle_label, fill=(0, 0, 0), font=font)
+            if frame_progress > 0:
+                # cv2 thick lines come out wider than PIL's at the same nominal
+                # width; thickness=2 matches the width=3 rays of the still frames
+                segments = ((ray_origin, tip), (tip, tip_barb1), (tip, tip_barb2))
+                for seg_start, seg_end in segments:
+                    cv2.line(frame, seg_start, seg_end, color=(255, 0, 0), 
+                             thickness=2, lineType=cv2.LINE_8)
             
-            frames.append(img)
+            yield Image.fromarray(frame)
         
         # Hold final position
-        final_frame = self._render_final_state(task_data)
+        if final_image is None:
+            final_image = self._render_final_state(task_data)
         for _ in range(hold_frames):
-            frames.append(final_frame)
-        
-        return frames
+            yield final_image
     
     # ══════════════════════════════════════════════════════════════════════════
     #  HELPER METHODS
     # ══════════════════════════════════════════════════════════════════════════
     
+    def _build_static_background(self) -> Image.Image:
+        """Render the frame-invariant scene: glass surface, hatch lines and normal."""
+        img = self.renderer.create_blank_image(bg_color=(255, 255, 255))
+        draw = ImageDraw.Draw(img)
+        
+        width, height = self.config.image_size
+        center_x, center_y = width // 2, height // 2
+        
+        # Glass surface: horizontal line in the middle
+        glass_y = center_y
+        glass_line_width = 3
+        draw.line([(0, glass_y), (width, glass_y)], fill=(0, 0, 0), width=glass_line_width)
+        
+        # Glass hatch lines (below the surface)
+        num_hatches = width // _HATCH_SPACING
+        
+        for i in range(num_hatches):
+            x = i * _HATCH_SPACING
+            # Draw diagonal hatch lines
+            x1 = x
+            y1 = glass_y + 5
+            x2 = x1 + _HATCH_DX
+            y2 = y1 + _HATCH_DY
+            draw.line([(x1, y1), (x2, y2)], fill=(100, 100, 100), width=1)
+        
+        # Normal line (perpendicular to glass surface)
+        normal_length = 30
+        draw.line([(center_x, glass_y - normal_length), (center_x, glass_y + normal_length)], 
+                 fill=(150, 150, 150), width=1)
+        
+        return img
+    
     def _draw_arrow(self, draw: ImageDraw.Draw, start: tuple, end: tuple, 
                    color: tuple = (0, 0, 0), width: int = 2):
         """Draw a line with an arrowhead at the end."""
-        # Draw the line
-        draw.line([start, end], fill=color, width=width)
-        
-        # Calculate arrowhead
-        dx = end[0] - start[0]
-        dy = end[1] - start[1]
-        angle = math.atan2(dy, dx)
-        
-        arrow_length = 15
-        arrow_angle = math.pi / 6  # 30 degrees
-        
-        # Arrowhead points
-        arrow1_x = end[0] - arrow_length * math.cos(angle - arrow_angle)
-        arrow1_y = end[1] - arrow_length * math.sin(angle - arrow_angle)
-        arrow2_x = end[0] - arrow_length * math.cos(angle + arrow_angle)
-        arrow2_y = end[1] - arrow_length * math.sin(angle + arrow_angle)
-        
-        # Draw arrowhead
-        draw.line([end, (arrow1_x, arrow1_y)], fill=color, width=width)
-        draw.line([end, (arrow2_x, arrow2_y)], fill=color, width=width)
+        for seg_start, seg_end in self._arrow_segments(start, end):
+            draw.line([seg_start, seg_end], fill=color, width=width)
     
-    def _get_font(self, size: int = 20) -> ImageFont.FreeTypeFont:
-        """Get a font for rendering text."""
-        # Try common fonts
-        font_names = [
-            "Arial.ttf",
-            "/System/Library/Fonts/Supplemental/Arial.ttf",
-            "/Library/Fonts/Arial.ttf",
-            "DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    @staticmethod
+    def _arrow_segments(start: tuple, end: tuple) -> list:
+        """Return the shaft and the two arrowhead strokes of an arrow as (start, end) pairs."""
+        arrow1_x, arrow1_y, arrow2_x, arrow2_y = arrowhead(start, end)
+        
+        return [
+            (start, end),
+            (end, (arrow1_x, arrow1_y)),
+            (end, (arrow2_x, arrow2_y)),
         ]
-        
-        for font_name in font_names:
-            try:
-                return ImageFont.truetype(font_name, size)
-            except (OSError, IOError):
-                continue
-        
-        # Fallback to default
-        return ImageFont.load_default()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _get_font(size: int = 20) -> ImageFont.FreeTypeFont:
+        """Get the bundled DejaVu Sans font for rendering text (cached per size)."""
+        font_path = importlib.resources.files(__package__) / "assets" / "DejaVuSans.ttf"
+        return ImageFont.truetype(str(font_path), size)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  PARALLEL WORKERS
+# ══════════════════════════════════════════════════════════════════════════════
+
+_worker_generator: Optional[TaskGenerator] = None
+
+
+def _init_worker(config: TaskConfig) -> None:
+    """Build the per-process generator once, when a pool worker starts."""
+    global _worker_generator
+    _worker_generator = TaskGenerator(config)
+
+
+def _generate_in_worker(task_id: str) -> TaskPair:
+    """Generate one task with this worker's generator."""
+    return _worker_generator._generate_one(task_id)
@@ -0,0 +1,67 @@
+"""
+Ray geometry helpers shared by the still-frame and animation renderers.
+
+Plain scalar functions, independent of the drawing backend (Pillow or OpenCV).
+"""
+
+import math
+
+
+def refracted_endpoint(
+    center_x: float,
+    glass_y: float,
+    width: float,
+    height: float,
+    sin_refracted: float,
+    cos_refracted: float
+) -> tuple[float, float]:
+    """
+    Find where a refracted ray leaving (center_x, glass_y) meets the image edge.
+
+    Parametric clipping of the ray (center_x + t*sin, glass_y + t*cos) against
+    the right, left and bottom edges; the nearest edge (smallest t) wins. Works
+    for any angle, including a vertical (sin == 0) or grazing (cos == 0) ray.
+
+    Args:
+        center_x, glass_y: Point where the ray enters the glass
+        width, height: Image dimensions
+        sin_refracted, cos_refracted: Direction of the ray, as sine and cosine of
+            the refraction angle measured from the normal
+
+    Returns:
+        (x, y) of the intersection with the bottom, right or left edge
+    """
+    t = math.inf
+    if sin_refracted > 0:
+        t = min(t, (width - center_x) / sin_refracted)
+    elif sin_refracted < 0:
+        t = min(t, -center_x / sin_refracted)
+    if cos_refracted > 0:
+        t = min(t, (height - glass_y) / cos_refracted)
+    return center_x + t * sin_refracted, glass_y + t * cos_refracted
+
+
+def arrowhead(
+    start: tuple[float, float],
+    end: tuple[float, float],
+    length: float = 15,
+    angle: float = math.pi / 6
+) -> tuple[float, float, float, float]:
+    """
+    Compute the two arrowhead barb tips for an arrow from start to end.
+
+    Args:
+        start, end: Arrow endpoints (the head is drawn at end)
+        length: Barb length in pixels
+        angle: Half-angle between the barbs and the shaft, in radians
+
+    Returns:
+        (x1, y1, x2, y2) coordinates of the two barb tips
+    """
+    shaft_angle = math.atan2(end[1] - start[1], end[0] - start[0])
+
+    x1 = end[0] - length * math.cos(shaft_angle - angle)
+    y1 = end[1] - length * math.sin(shaft_angle - angle)
+    x2 = end[0] - length * math.cos(shaft_angle + angle)
+    y2 = end[1] - length * math.sin(shaft_angle + angle)
+    return x1, y1, x2, y2
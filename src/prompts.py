@@ -15,11 +15,11 @@ import random
 # ══════════════════════════════════════════════════════════════════════════════
 
 PROMPTS = {
-    "default": [
+    "default": (
         "Given the refractive index of glass = {n_glass:.2f}, predict the refraction of light through the glass. The refracted ray should extend to the edge of the image.",
         "Given the glass refractive index = {n_glass:.2f}, predict how light refracts when passing through the glass. Extend the refracted ray to the image edge.",
         "Given the refractive index of glass = {n_glass:.2f}, predict the light refraction through the glass surface. The refracted ray must extend all the way to the edge of the image.",
-    ],
+    ),
 }
 
 
@@ -47,7 +47,7 @@ def get_prompt(task_type: str = "default", task_data: dict = None) -> str:
 
 def get_all_prompts(task_type: str = "default") -> list[str]:
     """Get all prompts for a given task type."""
-    return PROMPTS.get(task_type, PROMPTS["default"])
+    return list(PROMPTS.get(task_type, PROMPTS["default"]))
 
 
 # ══════════════════════════════════════════════════════════════════════════════